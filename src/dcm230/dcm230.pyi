@@ -1,7 +1,16 @@
+import functools
+import struct
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from decimal import Decimal
+from typing import TypeAlias
 
-from pymodbus.client import ModbusSerialClient
+from pymodbus.client import ModbusBaseClient, ModbusBaseSyncClient
 
+Decoder: TypeAlias = Callable[[float], Decimal | int]
+
+@dataclass(frozen=True, slots=True)
 class RegisterSpec:
     address: int
     count: int
@@ -12,8 +21,31 @@ class RegisterSpec:
     max: int = 0x7FFFFFFF
     writable: bool = False
     return_type: type[int | Decimal] = ...
+    scale: int = field(init=False)  # noqa: PYI015
+    decode: Decoder = field(init=False)  # noqa: PYI015
+
+def register_properties(cls: type[Dcm230]) -> type[Dcm230]: ...
+def _decode_decimal(value: float, scale: int, exponent: int) -> Decimal: ...
+def make_decoder(spec: RegisterSpec) -> Decoder: ...
+def make_getter(name: str, spec: RegisterSpec) -> Callable[[Dcm230], Decimal | int]: ...
+def make_setter(name: str, spec: RegisterSpec) -> Callable[[Dcm230, int], None]: ...
+
+class ReadPlan:
+    reg_type: int
+    address: int
+    count: int
+    names: tuple[str, ...]
+    offsets: tuple[int, ...]
+    specs: tuple[RegisterSpec, ...]
+    words: struct.Struct
+    layout: struct.Struct | None
+
+    @classmethod
+    def from_fields(cls, reg_type: int, address: int, end: int, fields: list[tuple[str, RegisterSpec]]) -> ReadPlan: ...
 
-    def register_properties(self) -> None: ...
+def build_read_plans(specs: dict[str, RegisterSpec], max_count: int, gap_tolerance: int) -> tuple[ReadPlan, ...]: ...
+@functools.lru_cache(maxsize=32)
+def _subset_plans(cls: type[Dcm230], names: frozenset[str]) -> tuple[ReadPlan, ...]: ...
 
 class Dcm230:
     RESET_MAX_DMD: int
@@ -22,9 +54,22 @@ class Dcm230:
     DCM230_REGISTER_BACKLIT_TIME: int
     INPUT_REGISTER: int
     HOLDING_REGISTER: int
-    _register_specs: RegisterSpec
+    SINGLE_REGISTER: int
+    MAX_REGS: int
+    BACKLIT_OPTIONS: list[int]
+    _BACKLIT_TIME_ALLOWED: frozenset[int]
+    MAX_READ_REGS: int
+    READ_GAP_TOLERANCE: int
+    CACHE_SIZE: int
+    _register_specs: dict[str, RegisterSpec]
+    _read_plans: tuple[ReadPlan, ...]
+    _cache: OrderedDict[tuple[int, int, int], tuple[int, list[int]]]
+    _async_client: bool
+    _sync_client: bool
 
-    def __init__(self, device_address: int, client: ModbusSerialClient) -> None: ...
+    def __init__(
+        self, device_address: int, client: ModbusBaseSyncClient | ModbusBaseClient, cache_ttl_ms: int = 0
+    ) -> None: ...
     V: Decimal
     A: Decimal
     W: Decimal
@@ -33,7 +78,7 @@ class Dcm230:
     W_dmd_peak: Decimal
     kwh_tot: Decimal
     kwh_partial: Decimal
-    dmd_period: Decimal
+    dmd_period: int
     backlit_time: int
     network_info: int
     device_id: int
@@ -42,10 +87,22 @@ class Dcm230:
     energy_measurement_tool: int
     serial_number: int
 
-    def _unpack(self, registers: list[int], address: int) -> int: ...
+    def _unpack(self, registers: list[int], address: int) -> float: ...
     def _write_registers(self, address: int, value: int) -> None: ...
-    def _read_register(self, register_name: str) -> Decimal | int: ...
-    def _read_input_registers(self, address: int, count: int) -> list[int]: ...
+    def _read_register(self, register_name: str, spec: RegisterSpec | None = None) -> Decimal | int: ...
     def _read_registers(self, address: int, count: int, reg_type: int) -> list[int]: ...
+    async def _read_registers_async(self, address: int, count: int, reg_type: int) -> list[int]: ...
+    async def _read_register_async(self, register_name: str, spec: RegisterSpec | None = None) -> Decimal | int: ...
+    def read_scaled(self, register_name: str) -> int: ...
+    def _decode(self, name: str, spec: RegisterSpec, unpacked: float, *, scaled: bool = False) -> Decimal | int: ...
+    @classmethod
+    def _plans_for(cls, names: Iterable[str] | None) -> tuple[ReadPlan, ...]: ...
+    def read_all(self, names: Iterable[str] | None = None) -> dict[str, Decimal | int]: ...
+    async def read_all_async(self, names: Iterable[str] | None = None) -> dict[str, Decimal | int]: ...
+    def _client_error(self, *, asynchronous: bool) -> TypeError: ...
+    def _backlit_error(self, value: int) -> ValueError: ...
+    def _cached(self, key: tuple[int, int, int]) -> list[int] | None: ...
+    def _store(self, key: tuple[int, int, int], regs: list[int]) -> None: ...
+    def invalidate_cache(self) -> None: ...
     def reset_max_dmd(self) -> None: ...
     def reset_partial_energy(self) -> None: ...
@@ -2,12 +2,71 @@
 
 """Test file for driver."""
 
+import asyncio
+import itertools
+import pickle
+import struct
 from contextlib import nullcontext
-from unittest.mock import MagicMock
+from dataclasses import dataclass, field
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient, ModbusSerialClient, ModbusTcpClient
 
 from dcm230 import Dcm230
+from dcm230.dcm230 import RegisterSpec, _subset_plans, build_read_plans
+
+_SPECS = tuple(Dcm230._register_specs.items())
+_INPUT_SPECS = tuple((name, spec) for name, spec in _SPECS if spec.reg_type == Dcm230.INPUT_REGISTER)
+_HOLDING_SPECS = tuple((name, spec) for name, spec in _SPECS if spec.reg_type == Dcm230.HOLDING_REGISTER)
+_WRITABLE_SPECS = tuple((name, spec) for name, spec in _SPECS if spec.writable)
+_RANGE_SPECS = tuple((name, spec) for name, spec in _SPECS if spec.range)
+
+
+@dataclass
+class _Response:
+    """Successful Modbus response returned by `_FakeClient`."""
+
+    registers: list[int] = field(default_factory=list)
+
+    def isError(self) -> bool:  # noqa: N802
+        """Mirror `ModbusPDU.isError`; fake responses never fail."""
+        return False
+
+
+class _FakeClient:
+    """Plain stand-in for `ModbusSerialClient` that records its calls.
+
+    Reads return `pattern` repeated to the requested count, so by default every
+    register pair decodes to 1.0, unless `canned` holds the registers returned
+    for the read address. Cheaper than a MagicMock for tests looping over every
+    register.
+    """
+
+    def __init__(self, pattern: list[int] | None = None, canned: dict[int, list[int]] | None = None) -> None:
+        self.pattern = [0x3F80, 0x0000] if pattern is None else pattern
+        self.canned = {} if canned is None else canned
+        self.input_reads: list[tuple[int, int, int]] = []
+        self.holding_reads: list[tuple[int, int, int]] = []
+        self.writes: list[tuple[int, list[int], int]] = []
+
+    def _response(self, address: int, count: int) -> _Response:
+        if address in self.canned:
+            return _Response(self.canned[address])
+        return _Response((self.pattern * (count // len(self.pattern) + 1))[:count])
+
+    def read_input_registers(self, address: int, count: int, device_id: int) -> _Response:
+        self.input_reads.append((address, count, device_id))
+        return self._response(address, count)
+
+    def read_holding_registers(self, address: int, count: int, device_id: int) -> _Response:
+        self.holding_reads.append((address, count, device_id))
+        return self._response(address, count)
+
+    def write_registers(self, address: int, values: list[int], device_id: int) -> _Response:
+        self.writes.append((address, values, device_id))
+        return _Response()
 
 
 def test_unpack() -> None:
@@ -20,6 +79,16 @@ def test_unpack() -> None:
     with pytest.raises(ValueError, match="Unexpected register count:"):
         _ = meter._unpack(registers, 0x0001)
 
+    """Test 2: Should pad a single register without modifying it."""
+    registers = [0x4366]
+    assert meter._unpack(registers, 0x0001) == 230
+    assert registers == [0x4366]
+
+    """Test 3: Should decode big-endian IEEE 754 floats."""
+    assert meter._unpack([0x4366, 0x0000], 0x0001) == 230.0
+    assert meter._unpack([0x4624, 0x1000], 0x0001) == 10500.0
+    assert meter._unpack([0xC2F6, 0xE979], 0x0001) == pytest.approx(-123.456)
+
 
 def test_read_register() -> None:
     """Test read_register."""
@@ -44,15 +113,11 @@ def test_read_register() -> None:
 
 def test_range_validation() -> None:
     """Test range validation."""
-    client = MagicMock()
-    meter = Dcm230(1, client)
+    client = _FakeClient()
+    meter = Dcm230(1, client)  # type: ignore[arg-type]
 
     """Test 1: Should not pass due to out of range."""
-    for name, spec in Dcm230._register_specs.items():  # type: ignore[attr-defined]
-        if not spec.range:
-            continue
-
-        client.write_registers.return_value.isError.return_value = False
+    for name, spec in _RANGE_SPECS:
         with nullcontext():
             _ = setattr(meter, name, spec.min)
 
@@ -65,61 +130,324 @@ def test_range_validation() -> None:
             setattr(meter, name, invalid_value)
 
 
+def test_read_integer_registers() -> None:
+    """Test decoding of integer registers."""
+    client = _FakeClient()
+    meter = Dcm230(1, client)  # type: ignore[arg-type]
+
+    """Test 1: Should validate the unpacked value before rounding it."""
+    client.pattern = [0x4270, 0x0000]
+    assert meter.dmd_period == 60
+    client.pattern = [0x4271, 0x999A]
+    assert meter.password == 60
+    for pattern in ([0x4271, 0x999A], [0xBECC, 0xCCCD]):
+        client.pattern = pattern
+        with pytest.raises(ValueError, match="Invalid value for 'dmd_period'"):
+            _ = meter.dmd_period
+        with pytest.raises(ValueError, match="Invalid value for 'dmd_period'"):
+            meter.read_all(["dmd_period"])
+
+    """Test 2: Should raise a named error for NaN and infinity."""
+    for pattern in ([0x7FC0, 0x0000], [0x7F80, 0x0000], [0xFF80, 0x0000]):
+        client.pattern = pattern
+        with pytest.raises(ValueError, match="Invalid value for 'dmd_period'"):
+            _ = meter.dmd_period
+        with pytest.raises(ValueError, match=r"Invalid value for 'password'.*finite"):
+            _ = meter.password
+        with pytest.raises(ValueError, match=r"Invalid value for 'serial_number'.*finite"):
+            meter.read_all(["serial_number"])
+
+
+def test_read_decimal_registers() -> None:
+    """Test decoding of Decimal registers."""
+    client = _FakeClient()
+    meter = Dcm230(1, client)  # type: ignore[arg-type]
+
+    """Test 1: Should return NaN and infinity as Decimal."""
+    client.pattern = [0x7FC0, 0x0000]
+    assert meter.V.is_nan()
+    client.pattern = [0x7F80, 0x0000]
+    assert str(meter.V) == "Infinity"
+    client.pattern = [0xFF80, 0x0000]
+    assert str(meter.V) == "-Infinity"
+
+    """Test 2: Should not fail a batched read because one register holds NaN."""
+    client.pattern = [0x7FC0, 0x0000]
+    values = meter.read_all(["V", "A", "W"])
+    assert all(isinstance(value, Decimal) and value.is_nan() for value in values.values())
+
+    """Test 3: Should pickle register specs together with their decoder."""
+    for spec in Dcm230._register_specs.values():
+        restored = pickle.loads(pickle.dumps(spec))  # noqa: S301
+        assert restored == spec
+        assert restored.decode(230.46) == spec.decode(230.46)
+
+
 def test_read_input_registers() -> None:
     """Test all input registers."""
-    client = MagicMock()
-    mock_result = MagicMock()
-    mock_result.isError.return_value = False
-    meter = Dcm230(1, client)
-
-    mock_result.registers = [0x3F80, 0x0000]
-    client.read_input_registers.return_value = mock_result
+    client = _FakeClient()
+    meter = Dcm230(1, client)  # type: ignore[arg-type]
 
     """Test 1: Should pass."""
-    for name, spec in Dcm230._register_specs.items():  # type: ignore[attr-defined]
-        if spec.reg_type != meter.INPUT_REGISTER:
-            continue
-
+    for name, spec in _INPUT_SPECS:
         value = getattr(meter, name)
         assert value == 1
+        assert client.input_reads[-1] == (spec.address, spec.count, 1)
+
+    """Test 2: Should read all of them with one read per coalesced run."""
+    client.input_reads.clear()
+    names = [name for name, _ in _INPUT_SPECS]
+    assert meter.read_all(names) == dict.fromkeys(names, 1)
+    assert client.input_reads == [(0x0000, 14, 1), (0x0048, 2, 1), (0x0054, 4, 1), (0x0156, 2, 1), (0x0180, 2, 1)]
 
 
 def test_read_holding_registers() -> None:
     """Test all holding registers."""
-    client = MagicMock()
-    mock_result = MagicMock()
-    mock_result.isError.return_value = False
-    meter = Dcm230(1, client)
-
-    mock_result.registers = [0x3F80, 0x0000]
-    client.read_holding_registers.return_value = mock_result
+    client = _FakeClient()
+    meter = Dcm230(1, client)  # type: ignore[arg-type]
 
     """Test 1: Should pass."""
-    for name, spec in Dcm230._register_specs.items():  # type: ignore[attr-defined]
-        if spec.reg_type != meter.HOLDING_REGISTER:
-            continue
-
+    for name, spec in _HOLDING_SPECS:
         value = getattr(meter, name)
         assert value == 1
+        assert client.holding_reads[-1] == (spec.address, spec.count, 1)
 
+    """Test 2: Should read all of them with one read per coalesced run."""
+    client.holding_reads.clear()
+    names = [name for name, _ in _HOLDING_SPECS]
+    assert meter.read_all(names) == dict.fromkeys(names, 1)
+    assert client.holding_reads == [(0x0002, 2, 1), (0x0012, 12, 1), (0xF920, 2, 1), (0xFC00, 2, 1)]
 
-def test_set_all_register() -> None:
-    """Test set all registers."""
+
+def test_read_scaled() -> None:
+    """Test scaled integer reads."""
     client = MagicMock()
     mock_result = MagicMock()
     mock_result.isError.return_value = False
-    client.write_registers.return_value = mock_result
+    client.read_input_registers.return_value = mock_result
+    client.read_holding_registers.return_value = mock_result
+    meter = Dcm230(1, client)
 
+    """Test 1: Should scale by the number of decimals."""
+    mock_result.registers = [0x4366, 0x8000]
+    assert meter.read_scaled("V") == 2305
+    assert meter.read_scaled("V") == meter.V * 10
+    assert str(meter.V) == "230.5"
+
+    """Test 2: Should not scale registers without decimals."""
+    mock_result.registers = [0x4270, 0x0000]
+    assert meter.read_scaled("dmd_period") == 60
+
+    """Test 3: Should raise a named error for NaN and infinity."""
+    for registers in ([0x7FC0, 0x0000], [0x7F80, 0x0000]):
+        mock_result.registers = registers
+        with pytest.raises(ValueError, match="Invalid value for 'V'"):
+            meter.read_scaled("V")
+
+    """Test 4: Should validate the range of registers that define one."""
+    mock_result.registers = [0x42C8, 0x0000]  # 100.0
+    with pytest.raises(ValueError, match="Invalid value for 'dmd_period'"):
+        meter.read_scaled("dmd_period")
+
+
+def test_build_read_plans() -> None:
+    """Test coalescing of register specifications into reads."""
+    specs = {
+        "a": RegisterSpec(address=0x0000, count=2, reg_type=Dcm230.INPUT_REGISTER),
+        "b": RegisterSpec(address=0x0004, count=2, reg_type=Dcm230.INPUT_REGISTER),
+        "c": RegisterSpec(address=0x0014, count=2, reg_type=Dcm230.INPUT_REGISTER),
+        "d": RegisterSpec(address=0x0000, count=2, reg_type=Dcm230.HOLDING_REGISTER),
+    }
+
+    def reads(max_count: int, gap_tolerance: int) -> list[tuple[int, int, int, tuple[str, ...]]]:
+        plans = build_read_plans(specs, max_count, gap_tolerance)
+        return [(plan.reg_type, plan.address, plan.count, plan.names) for plan in plans]
+
+    """Test 1: Should bridge gaps up to the gap tolerance, and split register types."""
+    assert reads(125, 2) == [
+        (Dcm230.INPUT_REGISTER, 0x0000, 6, ("a", "b")),
+        (Dcm230.INPUT_REGISTER, 0x0014, 2, ("c",)),
+        (Dcm230.HOLDING_REGISTER, 0x0000, 2, ("d",)),
+    ]
+
+    """Test 2: Should not bridge a gap longer than the gap tolerance."""
+    assert [plan[3] for plan in reads(125, 1)] == [("a",), ("b",), ("c",), ("d",)]
+
+    """Test 3: Should bridge every gap within the tolerance."""
+    assert [plan[3] for plan in reads(125, 14)] == [("a", "b", "c"), ("d",)]
+
+    """Test 4: Should split reads longer than the maximum count."""
+    assert [plan[3] for plan in reads(5, 14)] == [("a",), ("b",), ("c",), ("d",)]
+    assert [plan[3] for plan in reads(6, 14)] == [("a", "b"), ("c",), ("d",)]
+
+
+def test_read_all() -> None:
+    """Test batched read of all registers."""
+    client = _FakeClient()
+    meter = Dcm230(1, client)  # type: ignore[arg-type]
+
+    """Test 1: Should return every register using one read per plan."""
+    values = meter.read_all()
+    assert values.keys() == Dcm230._register_specs.keys()  # type: ignore[attr-defined]
+    assert all(value == 1 for value in values.values())
+    reads = len(client.input_reads) + len(client.holding_reads)
+    assert reads == len(Dcm230._read_plans)  # type: ignore[attr-defined]
+    assert reads < len(Dcm230._register_specs)  # type: ignore[attr-defined]
+
+    """Test 2: Should raise exception due to out of range value."""
+    client.pattern = [0x4F00, 0x0000]
+    with pytest.raises(ValueError, match="Invalid value for"):
+        meter.read_all()
+
+    """Test 3: Should decode each register from its own offset in the read."""
+    client.pattern = [0x3F80, 0x0000]
+    for plan in Dcm230._read_plans:  # type: ignore[attr-defined]
+        if plan.reg_type == meter.INPUT_REGISTER:
+            floats = range(plan.address, plan.address + plan.count, 2)
+            client.canned[plan.address] = list(
+                struct.unpack(f">{plan.count}H", struct.pack(f">{plan.count // 2}f", *floats))
+            )
+    values = meter.read_all()
+    for name, spec in _INPUT_SPECS:
+        assert values[name] == spec.address
+
+    """Test 4: Should reject a batched response that is one register short."""
+    client.canned[0x0000] = [0x4366, 0x0000] * 6 + [0x4366]
+    with pytest.raises(ValueError, match="Unexpected register count: 13 for address=0, expected 14"):
+        meter.read_all(["V", "A", "W"])
+
+    """Test 5: Should reject a single string instead of register names."""
+    with pytest.raises(TypeError, match="not a string"):
+        meter.read_all("kwh")
+
+    """Test 6: Should keep only the most recently used subset plans."""
+    _subset_plans.cache_clear()
+    maxsize = _subset_plans.cache_info().maxsize or 0
+    names = list(Dcm230._register_specs)  # type: ignore[attr-defined]
+    subsets = list(itertools.islice(itertools.combinations(names, 2), maxsize + 1))
+    try:
+        for subset in subsets:
+            _ = Dcm230._plans_for(subset)  # type: ignore[attr-defined]
+        assert _subset_plans.cache_info().currsize == maxsize
+        _ = Dcm230._plans_for(subsets[0])  # type: ignore[attr-defined]
+        assert _subset_plans.cache_info().misses == maxsize + 2
+    finally:
+        _subset_plans.cache_clear()
+
+
+def test_read_async() -> None:
+    """Test reads through an asyncio client."""
+    client = MagicMock()
     meter = Dcm230(1, client)
 
-    for name, spec in Dcm230._register_specs.items():  # type: ignore[attr-defined]
-        if not spec.writable:
-            continue
+    async def read(count: int, **_: int) -> MagicMock:
+        mock_result = MagicMock()
+        mock_result.isError.return_value = False
+        mock_result.registers = [0x3F80, 0x0000] * (count // 2)
+        return mock_result
+
+    client.read_input_registers = AsyncMock(side_effect=read)
+    client.read_holding_registers = AsyncMock(side_effect=read)
+
+    """Test 1: Should read a single register."""
+    assert asyncio.run(meter._read_register_async("V")) == 1
+    client.read_input_registers.assert_awaited_once_with(address=0x0000, count=2, device_id=1)
+
+    """Test 2: Should read all registers using one read per plan."""
+    client.read_input_registers.reset_mock()
+    values = asyncio.run(meter.read_all_async())
+    assert values.keys() == Dcm230._register_specs.keys()  # type: ignore[attr-defined]
+    assert all(value == 1 for value in values.values())
+    reads = client.read_input_registers.await_count + client.read_holding_registers.await_count
+    assert reads == len(Dcm230._read_plans)  # type: ignore[attr-defined]
+
+    """Test 3: Should reject synchronous access through an asyncio client."""
+    for client_type in (AsyncModbusSerialClient, AsyncModbusTcpClient):
+        async_client = MagicMock(spec=client_type)
+        meter = Dcm230(1, async_client, cache_ttl_ms=60_000)
+        with pytest.raises(TypeError, match="Use the \\*_async methods"):
+            _ = meter.V
+        with pytest.raises(TypeError, match="Use the \\*_async methods"):
+            meter.read_all()
+        with pytest.raises(TypeError, match="Use the \\*_async methods"):
+            meter.reset_max_dmd()
+        async_client.read_input_registers.assert_not_called()
+        async_client.write_registers.assert_not_called()
+
+    """Test 4: Should reject asynchronous access through a synchronous client."""
+    for client_type in (ModbusSerialClient, ModbusTcpClient):
+        sync_client = MagicMock(spec=client_type)
+        meter = Dcm230(1, sync_client)
+        with pytest.raises(TypeError, match="require an asyncio client"):
+            asyncio.run(meter.read_all_async())
+        sync_client.read_input_registers.assert_not_called()
+
+
+def test_read_cache() -> None:
+    """Test cached register reads."""
+    client = _FakeClient(pattern=[0x4366, 0x0000])
+
+    """Test 1: Should read the meter on every access when caching is disabled."""
+    meter = Dcm230(1, client)  # type: ignore[arg-type]
+    _ = meter.V
+    _ = meter.V
+    assert len(client.input_reads) == 2
+
+    """Test 2: Should reuse a fresh reading."""
+    client.input_reads.clear()
+    meter = Dcm230(1, client, cache_ttl_ms=60_000)  # type: ignore[arg-type]
+    assert meter.V == 230
+    assert meter.V == 230
+    assert len(client.input_reads) == 1
+
+    """Test 3: Should read the meter again after a write."""
+    meter.reset_partial_energy()
+    _ = meter.V
+    assert len(client.input_reads) == 2
+
+    """Test 4: Should read the meter again after invalidating the cache."""
+    meter.invalidate_cache()
+    _ = meter.V
+    assert len(client.input_reads) == 3
+
+    """Test 5: Should serve single registers from a batched read."""
+    client.input_reads.clear()
+    client.pattern = [0x3F80, 0x0000]
+    meter.invalidate_cache()
+    _ = meter.read_all(["V", "A", "W"])
+    assert (meter.V, meter.A, meter.W) == (1, 1, 1)
+    assert len(client.input_reads) == 1
+
+    """Test 6: Should evict the least recently used reads beyond the cache size."""
+    for address in range(meter.CACHE_SIZE + 1):
+        _ = meter._read_registers(address, 2, meter.INPUT_REGISTER)
+    assert len(meter._cache) == meter.CACHE_SIZE
+    assert (meter.INPUT_REGISTER, 0, 2) not in meter._cache
+
+    """Test 7: Should not cache a short response."""
+    client.canned[0x0000] = [0x3F80]
+    meter.invalidate_cache()
+    with pytest.raises(ValueError, match="Unexpected register count:"):
+        meter.read_all(["V", "A", "W"])
+    assert not meter._cache
+    del client.canned[0x0000]
+    assert meter.read_all(["V", "A", "W"]) == {"V": 1, "A": 1, "W": 1}
+
+    """Test 8: Should reject a negative time to live."""
+    with pytest.raises(ValueError, match="cache_ttl_ms must not be negative, got -1"):
+        Dcm230(1, client, cache_ttl_ms=-1)  # type: ignore[arg-type]
+
 
+def test_set_all_register() -> None:
+    """Test set all registers."""
+    client = _FakeClient()
+    meter = Dcm230(1, client)  # type: ignore[arg-type]
+
+    for name, spec in _WRITABLE_SPECS:
         value = 1
         setattr(meter, name, value)
-        client.write_registers.assert_called_once_with(address=spec.address, values=[1], device_id=1)
-        client.write_registers.reset_mock()
+        assert client.writes == [(spec.address, [1], 1)]
+        client.writes.clear()
 
 
 def test_backlit_time() -> None:
@@ -144,26 +472,23 @@ def test_backlit_time() -> None:
     meter.backlit_time = 60
     client.write_registers.assert_called_once_with(address=meter.DCM230_REGISTER_BACKLIT_TIME, values=[60], device_id=1)
 
+    """Test 4: Should raise exception when the meter reports an invalid option."""
+    mock_result.registers = [0x42C8, 0x0000]
+    with pytest.raises(ValueError, match="Invalid backlit option:"):
+        _ = meter.backlit_time
+
 
 def test_reset_functions() -> None:
     """Test all reset functions."""
-    client = MagicMock()
-    mock_result = MagicMock()
-    mock_result.isError.return_value = False
-    client.write_registers.return_value = mock_result
-
-    meter = Dcm230(1, client)
+    client = _FakeClient()
+    meter = Dcm230(1, client)  # type: ignore[arg-type]
 
     """Test 1: reset_max_dmd."""
     meter.reset_max_dmd()
-    client.write_registers.assert_called_once_with(
-        address=meter.DCM230_REGISTER_RESET_MAX_DMD_AND_PARTIAL_ENERGY, values=[meter.RESET_MAX_DMD], device_id=1
-    )
+    assert client.writes == [(meter.DCM230_REGISTER_RESET_MAX_DMD_AND_PARTIAL_ENERGY, [meter.RESET_MAX_DMD], 1)]
 
-    client.write_registers.reset_mock()
+    client.writes.clear()
 
     """Test 2: reset_partial_energy."""
     meter.reset_partial_energy()
-    client.write_registers.assert_called_once_with(
-        address=meter.DCM230_REGISTER_RESET_MAX_DMD_AND_PARTIAL_ENERGY, values=[meter.RESET_PARTIAL_ENERGY], device_id=1
-    )
+    assert client.writes == [(meter.DCM230_REGISTER_RESET_MAX_DMD_AND_PARTIAL_ENERGY, [meter.RESET_PARTIAL_ENERGY], 1)]